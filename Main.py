@@ -1,18 +1,13 @@
 import streamlit as st
 import numpy as np
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from scipy.stats import norm
+from scipy.special import erfc
 import math
+from typing import NamedTuple, Union
 
-st.set_page_config(
-    page_title="Black-Scholes Options Calculator",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
 
-st.markdown("""
+CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -56,113 +51,212 @@ st.markdown("""
         margin: 0.5rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+OPTION_CARD = """
+<div class="{css_class}">
+    <h3>{title}</h3>
+    <h2>${price:.2f}</h2>
+    <p>Intrinsic Value: ${intrinsic:.2f}</p>
+    <p>Time Value: ${time_value:.2f}</p>
+</div>
+"""
 
+GREEK_CARD = """
+<div class="greek-card">
+    <h4>{name}</h4>
+    <p style="margin: 0; color: #666;">{description}</p>
+</div>
+"""
 
-def black_scholes_price(S, K, T, r, sigma, q=0, option_type='call'):
-    if T <= 0 or sigma <= 0:
-        return 0
+st.set_page_config(
+    page_title="Black-Scholes Options Calculator",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
-    d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+st.markdown(CSS, unsafe_allow_html=True)
 
-    if option_type == 'call':
-        price = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-    else:
-        price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
 
-    return max(0, price)
+class Greeks(NamedTuple):
+    delta_call: Union[float, np.ndarray]
+    delta_put: Union[float, np.ndarray]
+    gamma: Union[float, np.ndarray]
+    vega: Union[float, np.ndarray]
+    theta_call: Union[float, np.ndarray]
+    theta_put: Union[float, np.ndarray]
+    rho_call: Union[float, np.ndarray]
+    rho_put: Union[float, np.ndarray]
+    d1: Union[float, np.ndarray]
+    d2: Union[float, np.ndarray]
 
 
-def calculate_greeks(S, K, T, r, sigma, q=0):
-    if T <= 0 or sigma <= 0:
-        return {
-            'delta_call': 0, 'delta_put': 0, 'gamma': 0, 'vega': 0,
-            'theta_call': 0, 'theta_put': 0, 'rho_call': 0, 'rho_put': 0,
-            'd1': 0, 'd2': 0
-        }
+class BSTerms(NamedTuple):
+    invalid: np.ndarray
+    T: np.ndarray
+    sigma: np.ndarray
+    sqrtT: np.ndarray
+    vol_sqrtT: np.ndarray
+    disc_r: np.ndarray
+    disc_q: np.ndarray
+    d1: np.ndarray
+    d2: np.ndarray
+    Nd1: np.ndarray
+    Nd2: np.ndarray
+    N_minus_d1: np.ndarray
+    N_minus_d2: np.ndarray
+    call: np.ndarray
+    put: np.ndarray
 
-    d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
 
-    delta_call = np.exp(-q * T) * norm.cdf(d1)
-    delta_put = np.exp(-q * T) * (norm.cdf(d1) - 1)
+def bs_terms(S, K, T, r, sigma, q=0):
+    invalid = (np.asarray(T) <= 0) | (np.asarray(sigma) <= 0)
 
-    gamma = np.exp(-q * T) * norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    if invalid.any():
+        T = np.where(invalid, 1.0, T)
+        sigma = np.where(invalid, 1.0, sigma)
 
-    vega = S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T) / 100
+    sqrtT = np.sqrt(T)
+    vol_sqrtT = sigma * sqrtT
+    disc_r = np.exp(-r * T)
+    disc_q = np.exp(-q * T)
 
-    theta_call = (-(S * norm.pdf(d1) * sigma * np.exp(-q * T)) / (2 * np.sqrt(T))
-                  - r * K * np.exp(-r * T) * norm.cdf(d2)
-                  + q * S * np.exp(-q * T) * norm.cdf(d1)) / 365
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / vol_sqrtT
+    d2 = d1 - vol_sqrtT
+    Nd1 = 0.5 * erfc(-d1 * INV_SQRT_2)
+    Nd2 = 0.5 * erfc(-d2 * INV_SQRT_2)
+    N_minus_d1 = 0.5 * erfc(d1 * INV_SQRT_2)
+    N_minus_d2 = 0.5 * erfc(d2 * INV_SQRT_2)
 
-    theta_put = (-(S * norm.pdf(d1) * sigma * np.exp(-q * T)) / (2 * np.sqrt(T))
-                 + r * K * np.exp(-r * T) * norm.cdf(-d2)
-                 - q * S * np.exp(-q * T) * norm.cdf(-d1)) / 365
+    spot_leg = S * disc_q
+    strike_leg = K * disc_r
+    call = np.maximum(0.0, spot_leg * Nd1 - strike_leg * Nd2)
+    put = np.maximum(0.0, strike_leg * N_minus_d2 - spot_leg * N_minus_d1)
 
-    rho_call = K * T * np.exp(-r * T) * norm.cdf(d2) / 100
-    rho_put = -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
+    return BSTerms(invalid, T, sigma, sqrtT, vol_sqrtT, disc_r, disc_q,
+                   d1, d2, Nd1, Nd2, N_minus_d1, N_minus_d2, call, put)
 
-    return {
-        'delta_call': delta_call, 'delta_put': delta_put,
-        'gamma': gamma, 'vega': vega,
-        'theta_call': theta_call, 'theta_put': theta_put,
-        'rho_call': rho_call, 'rho_put': rho_put,
-        'd1': d1, 'd2': d2
-    }
+
+def zero_invalid(value, invalid):
+    if not invalid.any():
+        return value
+    if np.ndim(value) == 0:
+        return np.float64(0.0)
+    np.copyto(value, 0.0, where=invalid)
+    return value
+
+
+def bs_call_put(S, K, T, r, sigma, q=0):
+    terms = bs_terms(S, K, T, r, sigma, q)
+    return zero_invalid(terms.call, terms.invalid), zero_invalid(terms.put, terms.invalid)
+
+
+def bs_full(S, K, T, r, sigma, q=0):
+    terms = bs_terms(S, K, T, r, sigma, q)
+
+    pdf_d1 = np.exp(-0.5 * terms.d1 * terms.d1) * INV_SQRT_2PI
+
+    delta_call = terms.disc_q * terms.Nd1
+    delta_put = terms.disc_q * (terms.Nd1 - 1)
+
+    gamma = terms.disc_q * pdf_d1 / (S * terms.vol_sqrtT)
+
+    vega = S * terms.disc_q * pdf_d1 * terms.sqrtT / 100
+
+    decay = -(S * pdf_d1 * terms.sigma * terms.disc_q) / (2 * terms.sqrtT)
+    theta_call = (decay - r * K * terms.disc_r * terms.Nd2
+                  + q * S * terms.disc_q * terms.Nd1) / 365
+    theta_put = (decay + r * K * terms.disc_r * terms.N_minus_d2
+                 - q * S * terms.disc_q * terms.N_minus_d1) / 365
+
+    rho_call = K * terms.T * terms.disc_r * terms.Nd2 / 100
+    rho_put = -K * terms.T * terms.disc_r * terms.N_minus_d2 / 100
+
+    values = (terms.call, terms.put, delta_call, delta_put, gamma, vega,
+              theta_call, theta_put, rho_call, rho_put, terms.d1, terms.d2)
+    call_price, put_price, *greeks = (zero_invalid(value, terms.invalid) for value in values)
+    return call_price, put_price, Greeks(*greeks)
+
+
+@st.cache_data(max_entries=128)
+def price_sensitivity_curves(S, K, T, r, sigma, q=0):
+    spot_range = np.linspace(S * 0.6, S * 1.4, 50, dtype=np.float64)
+    call_prices, put_prices = bs_call_put(spot_range, K, T, r, sigma, q)
+    call_intrinsics = np.maximum(0.0, spot_range - K)
+    put_intrinsics = np.maximum(0.0, K - spot_range)
+    return spot_range, call_prices, put_prices, call_intrinsics, put_intrinsics
+
+
+@st.cache_data(max_entries=128)
+def volatility_sensitivity_curves(S, K, T, r, q=0):
+    vol_range = np.linspace(0.1, 1.0, 30, dtype=np.float64)
+    call_vol_prices, put_vol_prices = bs_call_put(S, K, T, r, vol_range, q)
+    return vol_range, call_vol_prices, put_vol_prices
+
+
+@st.cache_data(max_entries=128)
+def greeks_sensitivity(S, K, T, r, sigma, q=0):
+    spot_range_greeks = np.linspace(S * 0.8, S * 1.2, 30, dtype=np.float64)
+    _, _, greeks_sweep = bs_full(spot_range_greeks, K, T, r, sigma, q)
+    return spot_range_greeks, greeks_sweep.delta_call, greeks_sweep.delta_put, greeks_sweep.gamma
+
+
+def update_line_figure(fig, x, ys, vlines):
+    for trace, y in zip(fig.data, ys):
+        trace.update(x=x, y=y)
+    for shape, annotation, (x_line, text) in zip(fig.layout.shapes, fig.layout.annotations, vlines):
+        shape.update(x0=x_line, x1=x_line)
+        annotation.update(x=x_line, text=text)
 
 
 st.markdown('<h1 class="main-header">Black-Scholes Options Calculator</h1>', unsafe_allow_html=True)
 
 st.sidebar.header("Option Parameters")
 
-S = st.sidebar.number_input("Spot Price ($)", value=100.0, min_value=0.01, step=0.01, format="%.2f")
-K = st.sidebar.number_input("Strike Price ($)", value=100.0, min_value=0.01, step=0.01, format="%.2f")
-T = st.sidebar.number_input("Time to Expiry (years)", value=1.0, min_value=0.001, step=0.01, format="%.3f")
-r = st.sidebar.number_input("Risk-Free Rate (%)", value=5.0, min_value=0.0, step=0.1, format="%.1f") / 100
-sigma = st.sidebar.number_input("Volatility (%)", value=20.0, min_value=0.1, step=0.1, format="%.1f") / 100
-q = st.sidebar.number_input("Dividend Yield (%)", value=0.0, min_value=0.0, step=0.1, format="%.1f") / 100
+with st.sidebar.form('params'):
+    S = st.number_input("Spot Price ($)", value=100.0, min_value=0.01, step=0.01, format="%.2f")
+    K = st.number_input("Strike Price ($)", value=100.0, min_value=0.01, step=0.01, format="%.2f")
+    T = st.number_input("Time to Expiry (years)", value=1.0, min_value=0.001, step=0.01, format="%.3f")
+    r = st.number_input("Risk-Free Rate (%)", value=5.0, min_value=0.0, step=0.1, format="%.1f") / 100
+    sigma = st.number_input("Volatility (%)", value=20.0, min_value=0.1, step=0.1, format="%.1f") / 100
+    q = st.number_input("Dividend Yield (%)", value=0.0, min_value=0.0, step=0.1, format="%.1f") / 100
+    st.form_submit_button('Recalculate')
+
+S, K, T, r, sigma, q = (np.float64(x) for x in (S, K, T, r, sigma, q))
 
-call_price = black_scholes_price(S, K, T, r, sigma, q, 'call')
-put_price = black_scholes_price(S, K, T, r, sigma, q, 'put')
-greeks = calculate_greeks(S, K, T, r, sigma, q)
+call_price, put_price, greeks = bs_full(S, K, T, r, sigma, q)
 
 call_intrinsic = max(0, S - K)
 put_intrinsic = max(0, K - S)
 
+import pandas as pd
+import plotly.express as px
+
 tab1, tab2, tab3 = st.tabs(["Calculator", "Price Sensitivity", "Greeks Analysis"])
 
 with tab1:
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(f"""
-        <div class="call-option">
-            <h3>Call Option</h3>
-            <h2>${call_price:.2f}</h2>
-            <p>Intrinsic Value: ${call_intrinsic:.2f}</p>
-            <p>Time Value: ${call_price - call_intrinsic:.2f}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(OPTION_CARD.format(css_class="call-option", title="Call Option",
+                                       price=call_price, intrinsic=call_intrinsic,
+                                       time_value=call_price - call_intrinsic),
+                    unsafe_allow_html=True)
 
     with col2:
-        st.markdown(f"""
-        <div class="put-option">
-            <h3>Put Option</h3>
-            <h2>${put_price:.2f}</h2>
-            <p>Intrinsic Value: ${put_intrinsic:.2f}</p>
-            <p>Time Value: ${put_price - put_intrinsic:.2f}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(OPTION_CARD.format(css_class="put-option", title="Put Option",
+                                       price=put_price, intrinsic=put_intrinsic,
+                                       time_value=put_price - put_intrinsic),
+                    unsafe_allow_html=True)
 
     st.markdown("---")
 
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("d₁", f"{greeks['d1']:.4f}")
+        st.metric("d₁", f"{greeks.d1:.4f}")
     with col2:
-        st.metric("d₂", f"{greeks['d2']:.4f}")
+        st.metric("d₂", f"{greeks.d2:.4f}")
     with col3:
         st.metric("Moneyness", f"{S / K:.4f}")
     with col4:
@@ -171,71 +265,70 @@ with tab1:
 with tab2:
     st.subheader("Price Sensitivity Analysis")
 
-    spot_range = np.linspace(S * 0.6, S * 1.4, 50)
-    call_prices = []
-    put_prices = []
-    call_intrinsics = []
-    put_intrinsics = []
-
-    for spot in spot_range:
-        call_prices.append(black_scholes_price(spot, K, T, r, sigma, q, 'call'))
-        put_prices.append(black_scholes_price(spot, K, T, r, sigma, q, 'put'))
-        call_intrinsics.append(max(0, spot - K))
-        put_intrinsics.append(max(0, K - spot))
-
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatter(x=spot_range, y=call_prices, mode='lines',
-                             name='Call Price', line=dict(color='green', width=3)))
-    fig.add_trace(go.Scatter(x=spot_range, y=put_prices, mode='lines',
-                             name='Put Price', line=dict(color='red', width=3)))
-
-    fig.add_trace(go.Scatter(x=spot_range, y=call_intrinsics, mode='lines',
-                             name='Call Intrinsic', line=dict(color='green', width=1, dash='dash')))
-    fig.add_trace(go.Scatter(x=spot_range, y=put_intrinsics, mode='lines',
-                             name='Put Intrinsic', line=dict(color='red', width=1, dash='dash')))
-
-    fig.add_vline(x=S, line_dash="dot", line_color="blue",
-                  annotation_text=f"Current Spot: ${S}")
-
-    fig.add_vline(x=K, line_dash="dot", line_color="purple",
-                  annotation_text=f"Strike: ${K}")
-
-    fig.update_layout(
-        title="Option Prices vs Spot Price",
-        xaxis_title="Spot Price ($)",
-        yaxis_title="Option Price ($)",
-        hovermode='x unified',
-        template='plotly_white'
-    )
+    spot_range, call_prices, put_prices, call_intrinsics, put_intrinsics = \
+        price_sensitivity_curves(S, K, T, r, sigma, q)
+    spot_vlines = [(S, f"Current Spot: ${S}"), (K, f"Strike: ${K}")]
+
+    if 'fig_spot' not in st.session_state:
+        spot_df = pd.DataFrame({
+            'spot': np.tile(spot_range, 4),
+            'price': np.concatenate([call_prices, put_prices, call_intrinsics, put_intrinsics]),
+            'series': np.repeat(['Call Price', 'Put Price', 'Call Intrinsic', 'Put Intrinsic'], len(spot_range))
+        })
+
+        fig = px.line(spot_df, x='spot', y='price', color='series', line_dash='series',
+                      labels={'spot': 'Spot Price ($)', 'price': 'Option Price ($)', 'series': ''},
+                      color_discrete_map={'Call Price': 'green', 'Put Price': 'red',
+                                          'Call Intrinsic': 'green', 'Put Intrinsic': 'red'},
+                      line_dash_map={'Call Price': 'solid', 'Put Price': 'solid',
+                                     'Call Intrinsic': 'dash', 'Put Intrinsic': 'dash'})
+        fig.for_each_trace(lambda trace: trace.update(line_width=1 if 'Intrinsic' in trace.name else 3))
+        fig.update_traces(hovertemplate=None)
+
+        for (x, text), color in zip(spot_vlines, ("blue", "purple")):
+            fig.add_vline(x=x, line_dash="dot", line_color=color, annotation_text=text)
+
+        fig.update_layout(
+            title="Option Prices vs Spot Price",
+            hovermode='x unified',
+            template='plotly_white'
+        )
+        st.session_state['fig_spot'] = fig
+
+    fig = st.session_state['fig_spot']
+    update_line_figure(fig, spot_range,
+                       (call_prices, put_prices, call_intrinsics, put_intrinsics), spot_vlines)
 
     st.plotly_chart(fig, use_container_width=True)
 
     st.subheader("Volatility Sensitivity")
 
-    vol_range = np.linspace(0.1, 1.0, 30)
-    call_vol_prices = []
-    put_vol_prices = []
+    vol_range, call_vol_prices, put_vol_prices = volatility_sensitivity_curves(S, K, T, r, q)
+    vol_vlines = [(sigma * 100, f"Current Vol: {sigma * 100:.1f}%")]
 
-    for vol in vol_range:
-        call_vol_prices.append(black_scholes_price(S, K, T, r, vol, q, 'call'))
-        put_vol_prices.append(black_scholes_price(S, K, T, r, vol, q, 'put'))
+    if 'fig_vol' not in st.session_state:
+        vol_df = pd.DataFrame({
+            'vol': np.tile(vol_range * 100, 2),
+            'price': np.concatenate([call_vol_prices, put_vol_prices]),
+            'series': np.repeat(['Call Price', 'Put Price'], len(vol_range))
+        })
 
-    fig_vol = go.Figure()
-    fig_vol.add_trace(go.Scatter(x=vol_range * 100, y=call_vol_prices, mode='lines',
-                                 name='Call Price', line=dict(color='green', width=3)))
-    fig_vol.add_trace(go.Scatter(x=vol_range * 100, y=put_vol_prices, mode='lines',
-                                 name='Put Price', line=dict(color='red', width=3)))
+        fig_vol = px.line(vol_df, x='vol', y='price', color='series',
+                          labels={'vol': 'Volatility (%)', 'price': 'Option Price ($)', 'series': ''},
+                          color_discrete_map={'Call Price': 'green', 'Put Price': 'red'})
+        fig_vol.update_traces(line_width=3, hovertemplate=None)
 
-    fig_vol.add_vline(x=sigma * 100, line_dash="dot", line_color="blue",
-                      annotation_text=f"Current Vol: {sigma * 100:.1f}%")
+        for x, text in vol_vlines:
+            fig_vol.add_vline(x=x, line_dash="dot", line_color="blue", annotation_text=text)
 
-    fig_vol.update_layout(
-        title="Option Prices vs Volatility",
-        xaxis_title="Volatility (%)",
-        yaxis_title="Option Price ($)",
-        template='plotly_white'
-    )
+        fig_vol.update_layout(
+            title="Option Prices vs Volatility",
+            template='plotly_white'
+        )
+        st.session_state['fig_vol'] = fig_vol
+
+    fig_vol = st.session_state['fig_vol']
+    update_line_figure(fig_vol, vol_range * 100, (call_vol_prices, put_vol_prices), vol_vlines)
 
     st.plotly_chart(fig_vol, use_container_width=True)
 
@@ -244,27 +337,23 @@ with tab3:
 
     greeks_data = [
         ("Delta", "Price sensitivity to underlying asset",
-         greeks['delta_call'], greeks['delta_put'], "4f"),
+         greeks.delta_call, greeks.delta_put, "4f"),
         ("Gamma", "Rate of change of delta",
-         greeks['gamma'], greeks['gamma'], "4f"),
+         greeks.gamma, greeks.gamma, "4f"),
         ("Vega", "Sensitivity to volatility (per 1%)",
-         greeks['vega'], greeks['vega'], "4f"),
+         greeks.vega, greeks.vega, "4f"),
         ("Theta", "Time decay (per day)",
-         greeks['theta_call'], greeks['theta_put'], "4f"),
+         greeks.theta_call, greeks.theta_put, "4f"),
         ("Rho", "Interest rate sensitivity (per 1%)",
-         greeks['rho_call'], greeks['rho_put'], "4f")
+         greeks.rho_call, greeks.rho_put, "4f")
     ]
 
     for greek_name, description, call_val, put_val, fmt in greeks_data:
         col1, col2, col3 = st.columns([2, 1, 1])
 
         with col1:
-            st.markdown(f"""
-            <div class="greek-card">
-                <h4>{greek_name}</h4>
-                <p style="margin: 0; color: #666;">{description}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(GREEK_CARD.format(name=greek_name, description=description),
+                        unsafe_allow_html=True)
 
         with col2:
             st.metric("Call", f"{call_val:.{fmt[-2:]}}")
@@ -274,32 +363,32 @@ with tab3:
 
     st.subheader("Greeks Visualization")
 
-    spot_range_greeks = np.linspace(S * 0.8, S * 1.2, 30)
-    deltas_call = []
-    deltas_put = []
-    gammas = []
-
-    for spot in spot_range_greeks:
-        greeks_temp = calculate_greeks(spot, K, T, r, sigma, q)
-        deltas_call.append(greeks_temp['delta_call'])
-        deltas_put.append(greeks_temp['delta_put'])
-        gammas.append(greeks_temp['gamma'])
-
-    fig_greeks = go.Figure()
-    fig_greeks.add_trace(go.Scatter(x=spot_range_greeks, y=deltas_call, mode='lines',
-                                    name='Call Delta', line=dict(color='green')))
-    fig_greeks.add_trace(go.Scatter(x=spot_range_greeks, y=deltas_put, mode='lines',
-                                    name='Put Delta', line=dict(color='red')))
-
-    fig_greeks.add_vline(x=S, line_dash="dot", line_color="blue",
-                         annotation_text=f"Current Spot: ${S}")
-
-    fig_greeks.update_layout(
-        title="Delta vs Spot Price",
-        xaxis_title="Spot Price ($)",
-        yaxis_title="Delta",
-        template='plotly_white'
-    )
+    spot_range_greeks, deltas_call, deltas_put, gammas = greeks_sensitivity(S, K, T, r, sigma, q)
+    delta_vlines = [(S, f"Current Spot: ${S}")]
+
+    if 'fig_greeks' not in st.session_state:
+        delta_df = pd.DataFrame({
+            'spot': np.tile(spot_range_greeks, 2),
+            'delta': np.concatenate([deltas_call, deltas_put]),
+            'series': np.repeat(['Call Delta', 'Put Delta'], len(spot_range_greeks))
+        })
+
+        fig_greeks = px.line(delta_df, x='spot', y='delta', color='series',
+                             labels={'spot': 'Spot Price ($)', 'delta': 'Delta', 'series': ''},
+                             color_discrete_map={'Call Delta': 'green', 'Put Delta': 'red'})
+        fig_greeks.update_traces(hovertemplate=None)
+
+        for x, text in delta_vlines:
+            fig_greeks.add_vline(x=x, line_dash="dot", line_color="blue", annotation_text=text)
+
+        fig_greeks.update_layout(
+            title="Delta vs Spot Price",
+            template='plotly_white'
+        )
+        st.session_state['fig_greeks'] = fig_greeks
+
+    fig_greeks = st.session_state['fig_greeks']
+    update_line_figure(fig_greeks, spot_range_greeks, (deltas_call, deltas_put), delta_vlines)
 
     st.plotly_chart(fig_greeks, use_container_width=True)
 